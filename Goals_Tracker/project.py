@@ -1,290 +1,655 @@
-import json
-import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
-from datetime import datetime
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-# ---------------------------- Data Handling ----------------------------
-class GoalTracker:
-    def __init__(self, file_path="goals.json"):
-        self.file_path = file_path
-        self.data = self.load_data()
-
-    def load_data(self):
-        try:
-            with open(self.file_path, "r") as f:
-                data = json.load(f)
-                # Handle legacy data format
-                if "goals" in data and "active_goals" not in data:
-                    data["active_goals"] = data.pop("goals")
-                # Initialize required keys
-                data.setdefault("active_goals", [])
-                data.setdefault("completed_goals", [])
-                # Ensure all goals have required fields
-                for goal in data["active_goals"]:
-                    goal.setdefault("unit", "units")
-                    goal.setdefault("missed_days", [])
-                    goal.setdefault("daily_logs", [])
-                return data
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {"active_goals": [], "completed_goals": []}
-
-    def save_data(self):
-        with open(self.file_path, "w") as f:
-            json.dump(self.data, f, indent=2)
-
-    def add_goal(self, name, total_target, weekly_target, unit):
-        self.data["active_goals"].append({
-            "name": name,
-            "total_target": float(total_target),
-            "weekly_target": float(weekly_target),
-            "unit": unit,
-            "daily_logs": [],
-        })
-        self.save_data()
-
-    def delete_goal(self, goal_name):
-        self.data["active_goals"] = [g for g in self.data["active_goals"] if g["name"] != goal_name]
-        self.save_data()
-
-    def complete_goal(self, goal):
-        goal["completion_date"] = datetime.now().strftime("%Y-%m-%d")
-        self.data["completed_goals"].append(goal)
-        self.data["active_goals"].remove(goal)
-        self.save_data()
-
-    def log_progress(self, goal_name, progress):
-        today = datetime.now().strftime("%Y-%m-%d")
-        for goal in self.data["active_goals"]:
-            if goal["name"] == goal_name:
-                
-                # Add progress
-                goal["daily_logs"].append({
-                    "date": today,
-                    "progress": float(progress)
-                })
-                
-                # Check for goal completion
-                total_progress = sum(log["progress"] for log in goal["daily_logs"])
-                if total_progress >= goal["total_target"]:
-                    self.complete_goal(goal)
-                self.save_data()
-                return True
-        return False
-
-    def log_missed_day(self, goal_name, reason):
-        today = datetime.now().strftime("%Y-%m-%d")
-        for goal in self.data["active_goals"]:
-            if goal["name"] == goal_name:
-                goal["missed_days"].append({
-                    "date": today,
-                    "reason": reason
-                })
-                self.save_data()
-                return True
-        return False
-
-    def get_weekly_progress(self, goal_name):
-        current_week = datetime.now().isocalendar()[1]
-        for goal in self.data["active_goals"]:
-            if goal["name"] == goal_name:
-                return sum(
-                    log["progress"] for log in goal["daily_logs"]
-                    if datetime.strptime(log["date"], "%Y-%m-%d").isocalendar()[1] == current_week
-                )
-        return 0
-
-# ---------------------------- GUI Application ----------------------------
-class GoalTrackerApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Goal Tracker")
-        self.tracker = GoalTracker()
-        self.setup_ui()
-        self.update_goal_dropdown()
-
-    def setup_ui(self):
-        # Configure style
-        self.style = ttk.Style()
-        self.style.configure("TButton", padding=6, font=("Arial", 10))
-        self.style.configure("TLabel", font=("Arial", 12))
-        
-        # Create notebook for tabs
-        self.notebook = ttk.Notebook(self.root)
-        self.active_tab = ttk.Frame(self.notebook)
-        self.completed_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.active_tab, text="Active Goals")
-        self.notebook.add(self.completed_tab, text="Completed Goals")
-        self.notebook.pack(expand=True, fill="both")
-
-        # ---------------------------- Active Goals Tab ----------------------------
-        # Add Goal Section
-        add_frame = ttk.Frame(self.active_tab, padding=20)
-        add_frame.pack(fill="x")
-        
-        ttk.Label(add_frame, text="Add New Goal", font=("Arial", 14, "bold")).grid(row=0, column=0, columnspan=5, pady=10)
-        
-        # Input fields
-        ttk.Label(add_frame, text="Goal Name").grid(row=1, column=0)
-        self.goal_name = ttk.Entry(add_frame, width=20)
-        self.goal_name.grid(row=2, column=0, padx=5)
-
-        ttk.Label(add_frame, text="Total Target").grid(row=1, column=1)
-        self.total_target = ttk.Entry(add_frame, width=10)
-        self.total_target.grid(row=2, column=1, padx=5)
-
-        ttk.Label(add_frame, text="Weekly Target").grid(row=1, column=2)
-        self.weekly_target = ttk.Entry(add_frame, width=10)
-        self.weekly_target.grid(row=2, column=2, padx=5)
-
-        ttk.Label(add_frame, text="Unit").grid(row=1, column=3)
-        self.unit = ttk.Entry(add_frame, width=10)
-        self.unit.grid(row=2, column=3, padx=5)
-
-        ttk.Button(add_frame, text="Add Goal", command=self.add_goal).grid(row=2, column=4, padx=10)
-
-        # Active Goals Display
-        self.active_goals_frame = ttk.Frame(self.active_tab)
-        self.active_goals_frame.pack(fill="both", expand=True)
-        self.refresh_active_goals()
-
-        # Progress Logging Section
-        log_frame = ttk.Frame(self.active_tab)
-        log_frame.pack(fill="x", pady=10)
-        
-        ttk.Label(log_frame, text="Log Daily Progress:").pack(side="left", padx=10)
-        self.selected_goal = tk.StringVar()
-        self.goal_dropdown = ttk.Combobox(log_frame, textvariable=self.selected_goal, width=25)
-        self.goal_dropdown.pack(side="left", padx=5)
-        
-        ttk.Label(log_frame, text="Progress:").pack(side="left", padx=5)
-        self.progress_entry = ttk.Entry(log_frame, width=10)
-        self.progress_entry.pack(side="left", padx=5)
-        
-        ttk.Button(log_frame, text="Log", command=self.log_progress).pack(side="left", padx=5)
-
-        # ---------------------------- Completed Goals Tab ----------------------------
-        completed_frame = ttk.Frame(self.completed_tab, padding=20)
-        completed_frame.pack(fill="both", expand=True)
-        
-        ttk.Label(completed_frame, text="Completed Goals", font=("Arial", 14, "bold")).pack(pady=10)
-        
-        self.completed_dropdown = ttk.Combobox(completed_frame, width=40, state="readonly")
-        self.completed_dropdown.pack(pady=10)
-        
-        ttk.Button(completed_frame, text="View Details", command=self.show_completed_details).pack()
-
-    def refresh_active_goals(self):
-        # Clear existing entries
-        for widget in self.active_goals_frame.winfo_children():
-            widget.destroy()
-        
-        # Create headers
-        headers = ["Goal", "Weekly Target", "Current", "Remaining", "Unit", "Status", ""]
-        for col, header in enumerate(headers):
-            ttk.Label(self.active_goals_frame, text=header, font=("Arial", 10, "bold")).grid(
-                row=0, column=col, padx=10, pady=5, sticky="w"
-            )
-
-        # Add goal rows
-        for row, goal in enumerate(self.tracker.data["active_goals"], start=1):
-            weekly_progress = self.tracker.get_weekly_progress(goal["name"])
-            remaining = max(goal["weekly_target"] - weekly_progress, 0)
-            status = "✅ On Track" if weekly_progress >= goal["weekly_target"] else "⚠️ Behind"
-
-            ttk.Label(self.active_goals_frame, text=goal["name"]).grid(row=row, column=0, padx=10, sticky="w")
-            ttk.Label(self.active_goals_frame, text=f"{goal['weekly_target']}").grid(row=row, column=1, padx=10)
-            ttk.Label(self.active_goals_frame, text=f"{weekly_progress:.1f}").grid(row=row, column=2, padx=10)
-            ttk.Label(self.active_goals_frame, text=f"{remaining:.1f}").grid(row=row, column=3, padx=10)
-            ttk.Label(self.active_goals_frame, text=goal["unit"]).grid(row=row, column=4, padx=10)
-            ttk.Label(self.active_goals_frame, text=status).grid(row=row, column=5, padx=10)
-            
-            # Delete button
-            ttk.Button(
-                self.active_goals_frame,
-                text="❌",
-                command=lambda g=goal["name"]: self.delete_goal(g)
-            ).grid(row=row, column=6, padx=10)
-
-    def add_goal(self):
-        name = self.goal_name.get().strip()
-        total = self.total_target.get().strip()
-        weekly = self.weekly_target.get().strip()
-        unit = self.unit.get().strip()
-
-        if not all([name, total, weekly, unit]):
-            messagebox.showerror("Error", "All fields are required!")
-            return
-
-        try:
-            self.tracker.add_goal(name, float(total), float(weekly), unit)
-            self.refresh_active_goals()
-            self.update_goal_dropdown()
-            # Clear input fields
-            self.goal_name.delete(0, tk.END)
-            self.total_target.delete(0, tk.END)
-            self.weekly_target.delete(0, tk.END)
-            self.unit.delete(0, tk.END)
-            messagebox.showinfo("Success", "Goal added successfully!")
-        except ValueError:
-            messagebox.showerror("Error", "Invalid number format in targets!")
-
-    def log_progress(self):
-        goal_name = self.selected_goal.get()
-        progress = self.progress_entry.get().strip()
-
-        if not goal_name:
-            messagebox.showerror("Error", "Please select a goal!")
-            return
-        if not progress:
-            messagebox.showerror("Error", "Please enter progress!")
-            return
-
-        try:
-            progress = float(progress)
-            if progress < 0:
-                raise ValueError
-        except ValueError:
-            messagebox.showerror("Error", "Progress must be a positive number!")
-            return
-
-        if self.tracker.log_progress(goal_name, progress):
-            self.refresh_active_goals()
-            self.progress_entry.delete(0, tk.END)
-            messagebox.showinfo("Success", "Progress logged successfully!")
-        else:
-            messagebox.showerror("Error", "Failed to log progress!")
-
-    def delete_goal(self, goal_name):
-        if messagebox.askyesno("Confirm Delete", f"Delete goal '{goal_name}'?"):
-            self.tracker.delete_goal(goal_name)
-            self.refresh_active_goals()
-            self.update_goal_dropdown()
-
-
-    def update_goal_dropdown(self):
-        self.goal_dropdown["values"] = [g["name"] for g in self.tracker.data["active_goals"]]
-        self.completed_dropdown["values"] = [g["name"] for g in self.tracker.data["completed_goals"]]
-
-    def show_completed_details(self):
-        goal_name = self.completed_dropdown.get()
-        if not goal_name:
-            return
-
-        for goal in self.tracker.data["completed_goals"]:
-            if goal["name"] == goal_name:
-                total = sum(log["progress"] for log in goal["daily_logs"])
-                details = (
-                    f"Goal: {goal['name']}\n"
-                    f"Total {goal['unit']}: {total:.1f}\n"
-                    f"Completed on: {goal.get('completion_date', 'N/A')}\n"
-                    f"Days Taken: {len(goal['daily_logs'])}"
-                )
-                messagebox.showinfo("Completed Goal Details", details)
-                break
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = GoalTrackerApp(root)
+import json
+import os
+import tkinter as tk
+from array import array
+from tkinter import ttk, messagebox, simpledialog
+from datetime import date
+
+# orjson (de)serializes several times faster than the stdlib; fall back
+# to json so the app still runs without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+# numpy is only used to vectorize sums over long log histories
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ---------------------------- Data Handling ----------------------------
+def _iso_week(date_str):
+    """ISO week number for a YYYY-MM-DD string.
+
+    date.fromisoformat is C-implemented and several times faster than
+    strptime, which matters when backfilling long log histories at load.
+    """
+    return date.fromisoformat(date_str).isocalendar()[1]
+
+
+class GoalTracker:
+    # Delay before a pending change is written to disk (milliseconds)
+    FLUSH_DELAY_MS = 500
+    # Force a snapshot after this many events even without idle time
+    COMPACT_EVERY = 512
+    # Below this many logs the plain Python sum beats numpy's setup cost
+    VECTORIZE_MIN = 256
+
+    def __init__(self, file_path="goals.json", root=None):
+        self.file_path = file_path
+        self.log_path = os.path.splitext(file_path)[0] + ".log"
+        self.root = root
+        self._dirty = False
+        self._pending_after = None
+        self._log_file = None
+        self._ops_since_compact = 0
+        self.data = self.load_data()
+        # Name indexes so goal lookups don't scan the whole lists
+        self._by_name = {g["name"]: g for g in self.data["active_goals"]}
+        self._completed_by_name = {g["name"]: g for g in self.data["completed_goals"]}
+        self._replay_log()
+        if self._dirty:
+            # load_data cleaned something up (e.g. renamed duplicate
+            # names) — schedule a write of the repaired state
+            self._mark_dirty()
+
+    def load_data(self):
+        try:
+            # One bulk read with a 64KB buffer instead of the parser's
+            # many small reads; an empty file just means a fresh start
+            with open(self.file_path, "rb", buffering=1 << 16) as f:
+                raw = f.read()
+            if not raw:
+                return {"active_goals": [], "completed_goals": []}
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            # Handle legacy data format
+            if "goals" in data and "active_goals" not in data:
+                data["active_goals"] = data.pop("goals")
+            # Initialize required keys
+            data.setdefault("active_goals", [])
+            data.setdefault("completed_goals", [])
+            # Ensure all goals have required fields
+            current_week = date.today().isocalendar()[1]
+            seen_names = set()
+            for goal in data["active_goals"]:
+                # Files written before names became keys may hold
+                # duplicates; rename them apart rather than losing the
+                # shadowed goal's history, and persist the cleaned state
+                if goal["name"] in seen_names:
+                    base = goal["name"]
+                    suffix = 2
+                    while f"{base} ({suffix})" in seen_names:
+                        suffix += 1
+                    goal["name"] = f"{base} ({suffix})"
+                    self._dirty = True
+                seen_names.add(goal["name"])
+                goal.setdefault("unit", "units")
+                goal.setdefault("missed_days", [])
+                self._logs_to_arrays(goal)
+                # Running totals, maintained incrementally by log_progress
+                # so nothing ever has to re-sum the whole history
+                goal["_total"], goal["_weekly"] = self._sum_logs(goal, current_week)
+                goal["_weekly_week"] = current_week
+            for goal in data["completed_goals"]:
+                self._logs_to_arrays(goal)
+            return data
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"active_goals": [], "completed_goals": []}
+
+    @staticmethod
+    def _logs_to_arrays(goal):
+        # In memory the logs live as parallel arrays — contiguous C
+        # doubles and shorts scan far faster than a dict per log entry.
+        # The on-disk format stays the legacy list of dicts.
+        logs = goal.pop("daily_logs", [])
+        goal["log_dates"] = [log["date"] for log in logs]
+        goal["log_progress"] = array("d", (log["progress"] for log in logs))
+        goal["log_weeks"] = array(
+            "H", (log.get("_week") or _iso_week(log["date"]) for log in logs)
+        )
+
+    @classmethod
+    def _sum_logs(cls, goal, current_week):
+        """Total and current-week progress sums for a goal's logs."""
+        progress = goal["log_progress"]
+        weeks = goal["log_weeks"]
+        if np is not None and len(progress) > cls.VECTORIZE_MIN:
+            # The arrays expose their buffers directly, so this is a
+            # zero-copy view and both sums run as single C loops
+            prog = np.frombuffer(progress, dtype=np.float64)
+            wks = np.frombuffer(weeks, dtype=np.uint16)
+            return float(prog.sum()), float(prog[wks == current_week].sum())
+        total = sum(progress)
+        weekly = sum(p for p, w in zip(progress, weeks) if w == current_week)
+        return total, weekly
+
+    @staticmethod
+    def _goal_to_json(goal):
+        # Zip the arrays back into the legacy daily_logs format and drop
+        # the in-memory-only fields
+        out = {
+            k: v for k, v in goal.items()
+            if not k.startswith("_") and not k.startswith("log_")
+        }
+        out["daily_logs"] = [
+            {"date": d, "progress": p, "_week": w}
+            for d, p, w in zip(goal["log_dates"], goal["log_progress"], goal["log_weeks"])
+        ]
+        return out
+
+    def save_data(self):
+        # Write any pending state now; _flush is a no-op when nothing
+        # has changed since the last snapshot
+        self._flush()
+
+    def _mark_dirty(self):
+        # Coalesce bursts of mutations into a single deferred write instead
+        # of rewriting the whole file on every change.
+        self._dirty = True
+        if self.root is None:
+            self._flush()
+        elif self._pending_after is None:
+            self._pending_after = self.root.after(self.FLUSH_DELAY_MS, self._flush)
+
+    def _flush(self):
+        self._pending_after = None
+        if not self._dirty:
+            return
+        # Write to a temp file and swap it in so a crash mid-write
+        # never leaves goals.json half-written.
+        tmp_path = self.file_path + ".tmp"
+        with open(tmp_path, "wb", buffering=1 << 16) as f:
+            self._stream_dump(f)
+        # The snapshot covers every event recorded so far, so the event
+        # log restarts empty. Truncating before the rename means a crash
+        # in between can only lose the debounce window, never replay
+        # events on top of a snapshot that already contains them.
+        self._truncate_log()
+        os.replace(tmp_path, self.file_path)
+        self._dirty = False
+        self._ops_since_compact = 0
+
+    def _dump_goal(self, goal):
+        # Compact output — the file is machine-read, and indentation
+        # roughly doubles the bytes written and re-parsed
+        converted = self._goal_to_json(goal)
+        if orjson:
+            return orjson.dumps(converted)
+        return json.dumps(converted, separators=(",", ":")).encode("utf-8")
+
+    def _stream_dump(self, f):
+        # Emit the snapshot one goal at a time straight into the buffered
+        # file, so peak memory is one goal's JSON rather than the whole
+        # serialized history
+        f.write(b'{"active_goals":[')
+        for i, goal in enumerate(self.data["active_goals"]):
+            if i:
+                f.write(b",")
+            f.write(self._dump_goal(goal))
+        f.write(b'],"completed_goals":[')
+        for i, goal in enumerate(self.data["completed_goals"]):
+            if i:
+                f.write(b",")
+            f.write(self._dump_goal(goal))
+        f.write(b"]}")
+
+    def _record(self, event):
+        # Appending one event line is O(1) no matter how much history
+        # exists, unlike re-serializing all of goals.json
+        if self._log_file is None:
+            self._log_file = open(self.log_path, "ab", buffering=1 << 16)
+        if orjson:
+            line = orjson.dumps(event)
+        else:
+            line = json.dumps(event, separators=(",", ":")).encode("utf-8")
+        self._log_file.write(line + b"\n")
+        self._log_file.flush()
+        self._ops_since_compact += 1
+        if self._ops_since_compact >= self.COMPACT_EVERY:
+            self.save_data()
+        else:
+            self._mark_dirty()
+
+    def _replay_log(self):
+        # Events recorded since the last snapshot live in the append-only
+        # log; fold them back into the loaded state
+        try:
+            with open(self.log_path, "rb", buffering=1 << 16) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        replayed = False
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = orjson.loads(line) if orjson else json.loads(line)
+            except ValueError:
+                # Truncated trailing line from a crash mid-append
+                break
+            self._apply_event(event)
+            replayed = True
+        if replayed:
+            # Fold the replayed events into the next snapshot
+            self._mark_dirty()
+
+    def _truncate_log(self):
+        if self._log_file is not None:
+            self._log_file.truncate(0)
+        else:
+            try:
+                os.remove(self.log_path)
+            except FileNotFoundError:
+                pass
+
+    def _apply_event(self, event):
+        # Pure in-memory state transition, shared by the live mutation
+        # methods and startup replay — no I/O here
+        op = event["op"]
+        if op == "add":
+            if event["name"] in self._by_name:
+                # A second goal under the same name would orphan the
+                # first everywhere the name is used as a key
+                return
+            new_goal = {
+                "name": event["name"],
+                "total_target": event["total_target"],
+                "weekly_target": event["weekly_target"],
+                "unit": event["unit"],
+                "log_dates": [],
+                "log_progress": array("d"),
+                "log_weeks": array("H"),
+                "missed_days": [],
+                "_total": 0.0,
+                "_weekly": 0.0,
+                "_weekly_week": date.today().isocalendar()[1],
+            }
+            self.data["active_goals"].append(new_goal)
+            self._by_name[event["name"]] = new_goal
+        elif op == "log":
+            goal = self._by_name.get(event["name"])
+            if goal is None:
+                return
+            progress = event["progress"]
+            week = event["week"]
+            goal["log_dates"].append(event["date"])
+            goal["log_progress"].append(progress)
+            goal["log_weeks"].append(week)
+            # Bump the running totals, resetting weekly on week rollover
+            goal["_total"] += progress
+            if goal["_weekly_week"] == week:
+                goal["_weekly"] += progress
+            else:
+                goal["_weekly"] = progress
+                goal["_weekly_week"] = week
+        elif op == "miss":
+            goal = self._by_name.get(event["name"])
+            if goal is None:
+                return
+            goal["missed_days"].append({
+                "date": event["date"],
+                "reason": event["reason"]
+            })
+        elif op == "delete":
+            if self._by_name.pop(event["name"], None) is not None:
+                self.data["active_goals"] = [
+                    g for g in self.data["active_goals"] if g["name"] != event["name"]
+                ]
+        elif op == "complete":
+            goal = self._by_name.pop(event["name"], None)
+            if goal is None:
+                return
+            goal["completion_date"] = event["date"]
+            # A completed goal never changes, so freeze its summary
+            # stats here instead of re-summing them on every details view
+            goal["final_total"] = goal["_total"]
+            goal["days_taken"] = len(goal["log_dates"])
+            self.data["completed_goals"].append(goal)
+            self.data["active_goals"].remove(goal)
+            self._completed_by_name[goal["name"]] = goal
+
+    def close(self):
+        # Final snapshot so the next start doesn't need to replay
+        self._flush()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def add_goal(self, name, total_target, weekly_target, unit):
+        if name in self._by_name:
+            return False
+        event = {
+            "op": "add",
+            "name": name,
+            "total_target": float(total_target),
+            "weekly_target": float(weekly_target),
+            "unit": unit,
+        }
+        self._apply_event(event)
+        self._record(event)
+        return True
+
+    def delete_goal(self, goal_name):
+        if goal_name not in self._by_name:
+            # Nothing to delete — don't record an event or touch the disk
+            return
+        event = {"op": "delete", "name": goal_name}
+        self._apply_event(event)
+        self._record(event)
+
+    def complete_goal(self, goal):
+        event = {
+            "op": "complete",
+            "name": goal["name"],
+            "date": date.today().isoformat(),
+        }
+        self._apply_event(event)
+        self._record(event)
+
+    def log_progress(self, goal_name, progress):
+        goal = self._by_name.get(goal_name)
+        if goal is None:
+            return False
+        today = date.today()
+        event = {
+            "op": "log",
+            "name": goal_name,
+            "date": today.isoformat(),
+            "week": today.isocalendar()[1],
+            "progress": float(progress),
+        }
+        self._apply_event(event)
+        self._record(event)
+
+        # Check for goal completion
+        if goal["_total"] >= goal["total_target"]:
+            self.complete_goal(goal)
+        return True
+
+    def log_missed_day(self, goal_name, reason):
+        if goal_name not in self._by_name:
+            return False
+        event = {
+            "op": "miss",
+            "name": goal_name,
+            "date": date.today().isoformat(),
+            "reason": reason,
+        }
+        self._apply_event(event)
+        self._record(event)
+        return True
+
+    def get_weekly_progress(self, goal_name):
+        goal = self._by_name.get(goal_name)
+        if goal is None:
+            return 0
+        return self._weekly_progress(goal, date.today().isocalendar()[1])
+
+    def _weekly_progress(self, goal, current_week):
+        # Variant for callers iterating many goals, so the current week
+        # is computed once instead of per goal
+        if goal["_weekly_week"] != current_week:
+            return 0
+        return goal["_weekly"]
+
+# ---------------------------- GUI Application ----------------------------
+class GoalTrackerApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Goal Tracker")
+        self.tracker = GoalTracker(root=root)
+        self.setup_ui()
+        self.update_goal_dropdown()
+        # Make sure any pending changes hit disk before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def setup_ui(self):
+        # Configure style
+        self.style = ttk.Style()
+        self.style.configure("TButton", padding=6, font=("Arial", 10))
+        self.style.configure("TLabel", font=("Arial", 12))
+        
+        # Create notebook for tabs
+        self.notebook = ttk.Notebook(self.root)
+        self.active_tab = ttk.Frame(self.notebook)
+        self.completed_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.active_tab, text="Active Goals")
+        self.notebook.add(self.completed_tab, text="Completed Goals")
+        self.notebook.pack(expand=True, fill="both")
+
+        # ---------------------------- Active Goals Tab ----------------------------
+        # Add Goal Section
+        add_frame = ttk.Frame(self.active_tab, padding=20)
+        add_frame.pack(fill="x")
+        
+        ttk.Label(add_frame, text="Add New Goal", font=("Arial", 14, "bold")).grid(row=0, column=0, columnspan=5, pady=10)
+        
+        # Input fields
+        ttk.Label(add_frame, text="Goal Name").grid(row=1, column=0)
+        self.goal_name = ttk.Entry(add_frame, width=20)
+        self.goal_name.grid(row=2, column=0, padx=5)
+
+        ttk.Label(add_frame, text="Total Target").grid(row=1, column=1)
+        self.total_target = ttk.Entry(add_frame, width=10)
+        self.total_target.grid(row=2, column=1, padx=5)
+
+        ttk.Label(add_frame, text="Weekly Target").grid(row=1, column=2)
+        self.weekly_target = ttk.Entry(add_frame, width=10)
+        self.weekly_target.grid(row=2, column=2, padx=5)
+
+        ttk.Label(add_frame, text="Unit").grid(row=1, column=3)
+        self.unit = ttk.Entry(add_frame, width=10)
+        self.unit.grid(row=2, column=3, padx=5)
+
+        ttk.Button(add_frame, text="Add Goal", command=self.add_goal).grid(row=2, column=4, padx=10)
+
+        # Active Goals Display — one Treeview instead of a grid of
+        # Labels, which Tk creates and updates an order of magnitude faster
+        columns = ("name", "weekly", "current", "remaining", "unit", "status")
+        headings = ("Goal", "Weekly Target", "Current", "Remaining", "Unit", "Status")
+        self.goals_tree = ttk.Treeview(self.active_tab, columns=columns, show="headings", height=10)
+        for col, heading in zip(columns, headings):
+            self.goals_tree.heading(col, text=heading)
+            self.goals_tree.column(col, width=110, anchor="w")
+        self.goals_tree.pack(fill="both", expand=True, padx=10)
+        self.refresh_active_goals()
+
+        ttk.Button(self.active_tab, text="Delete Selected", command=self.delete_selected_goal).pack(pady=5)
+
+        # Progress Logging Section
+        log_frame = ttk.Frame(self.active_tab)
+        log_frame.pack(fill="x", pady=10)
+        
+        ttk.Label(log_frame, text="Log Daily Progress:").pack(side="left", padx=10)
+        self.selected_goal = tk.StringVar()
+        self.goal_dropdown = ttk.Combobox(log_frame, textvariable=self.selected_goal, width=25)
+        self.goal_dropdown.pack(side="left", padx=5)
+        
+        ttk.Label(log_frame, text="Progress:").pack(side="left", padx=5)
+        self.progress_entry = ttk.Entry(log_frame, width=10)
+        self.progress_entry.pack(side="left", padx=5)
+        
+        ttk.Button(log_frame, text="Log", command=self.log_progress).pack(side="left", padx=5)
+
+        # ---------------------------- Completed Goals Tab ----------------------------
+        completed_frame = ttk.Frame(self.completed_tab, padding=20)
+        completed_frame.pack(fill="both", expand=True)
+        
+        ttk.Label(completed_frame, text="Completed Goals", font=("Arial", 14, "bold")).pack(pady=10)
+        
+        self.completed_dropdown = ttk.Combobox(completed_frame, width=40, state="readonly")
+        self.completed_dropdown.pack(pady=10)
+        
+        ttk.Button(completed_frame, text="View Details", command=self.show_completed_details).pack()
+
+    def refresh_active_goals(self):
+        # Full rebuild — only needed on initial mount; later changes go
+        # through _add_goal_row/_update_row/_remove_row so a single click
+        # touches one row instead of repopulating the table
+        # Bind the hot lookups to locals — per-iteration attribute
+        # resolution is measurable once the goal list is long
+        tree = self.goals_tree
+        tree.delete(*tree.get_children())
+        insert = tree.insert
+        row_values = self._row_values
+        current_week = date.today().isocalendar()[1]
+        for goal in self.tracker.data["active_goals"]:
+            insert("", "end", iid=goal["name"], values=row_values(goal, current_week))
+
+    def _row_values(self, goal, current_week):
+        weekly_progress = self.tracker._weekly_progress(goal, current_week)
+        remaining = max(goal["weekly_target"] - weekly_progress, 0)
+        status = "✅ On Track" if weekly_progress >= goal["weekly_target"] else "⚠️ Behind"
+        return (
+            goal["name"],
+            goal["weekly_target"],
+            f"{weekly_progress:.1f}",
+            f"{remaining:.1f}",
+            goal["unit"],
+            status,
+        )
+
+    def _add_goal_row(self, goal, current_week=None):
+        if current_week is None:
+            current_week = date.today().isocalendar()[1]
+        self.goals_tree.insert("", "end", iid=goal["name"], values=self._row_values(goal, current_week))
+
+    def _update_row(self, goal_name):
+        goal = self.tracker._by_name.get(goal_name)
+        if goal is None or not self.goals_tree.exists(goal_name):
+            return
+        current_week = date.today().isocalendar()[1]
+        self.goals_tree.item(goal_name, values=self._row_values(goal, current_week))
+
+    def _remove_row(self, goal_name):
+        if self.goals_tree.exists(goal_name):
+            self.goals_tree.delete(goal_name)
+
+    def delete_selected_goal(self):
+        selection = self.goals_tree.selection()
+        if not selection:
+            messagebox.showerror("Error", "Please select a goal to delete!")
+            return
+        self.delete_goal(selection[0])
+
+    def add_goal(self):
+        name = self.goal_name.get().strip()
+        total = self.total_target.get().strip()
+        weekly = self.weekly_target.get().strip()
+        unit = self.unit.get().strip()
+
+        if not all([name, total, weekly, unit]):
+            messagebox.showerror("Error", "All fields are required!")
+            return
+
+        try:
+            if not self.tracker.add_goal(name, float(total), float(weekly), unit):
+                # Names key the tracker index, the table rows and the
+                # dropdown, so a second goal under one name can't exist
+                messagebox.showerror("Error", f"Goal '{name}' already exists!")
+                return
+            self._add_goal_row(self.tracker._by_name[name])
+            self._on_goal_added(name)
+            # Clear input fields
+            self.goal_name.delete(0, tk.END)
+            self.total_target.delete(0, tk.END)
+            self.weekly_target.delete(0, tk.END)
+            self.unit.delete(0, tk.END)
+            # Settle all pending layout work in one pass before the modal
+            # dialog takes over the event loop
+            self.root.update_idletasks()
+            messagebox.showinfo("Success", "Goal added successfully!")
+        except ValueError:
+            messagebox.showerror("Error", "Invalid number format in targets!")
+
+    def log_progress(self):
+        goal_name = self.selected_goal.get()
+        progress = self.progress_entry.get().strip()
+
+        if not goal_name:
+            messagebox.showerror("Error", "Please select a goal!")
+            return
+        if not progress:
+            messagebox.showerror("Error", "Please enter progress!")
+            return
+
+        try:
+            progress = float(progress)
+            if progress < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Progress must be a positive number!")
+            return
+
+        if self.tracker.log_progress(goal_name, progress):
+            if goal_name in self.tracker._by_name:
+                self._update_row(goal_name)
+            else:
+                # The log completed the goal, so its row goes away
+                self._remove_row(goal_name)
+                self._on_goal_removed(goal_name, completed=True)
+            self.progress_entry.delete(0, tk.END)
+            self.root.update_idletasks()
+            messagebox.showinfo("Success", "Progress logged successfully!")
+        else:
+            messagebox.showerror("Error", "Failed to log progress!")
+
+    def delete_goal(self, goal_name):
+        if messagebox.askyesno("Confirm Delete", f"Delete goal '{goal_name}'?"):
+            self.tracker.delete_goal(goal_name)
+            self._remove_row(goal_name)
+            self._on_goal_removed(goal_name)
+
+
+    def update_goal_dropdown(self):
+        # Full rebuild for initial mount; mutations keep the cached name
+        # lists in sync instead of rescanning every goal
+        self._active_names = [g["name"] for g in self.tracker.data["active_goals"]]
+        self._completed_names = [g["name"] for g in self.tracker.data["completed_goals"]]
+        self.goal_dropdown["values"] = tuple(self._active_names)
+        self.completed_dropdown["values"] = tuple(self._completed_names)
+
+    def _on_goal_added(self, name):
+        if name not in self._active_names:
+            self._active_names.append(name)
+            self.goal_dropdown["values"] = tuple(self._active_names)
+
+    def _on_goal_removed(self, name, completed=False):
+        if name in self._active_names:
+            self._active_names.remove(name)
+            self.goal_dropdown["values"] = tuple(self._active_names)
+        if completed:
+            self._completed_names.append(name)
+            self.completed_dropdown["values"] = tuple(self._completed_names)
+
+    def show_completed_details(self):
+        goal_name = self.completed_dropdown.get()
+        if not goal_name:
+            return
+
+        goal = self.tracker._completed_by_name.get(goal_name)
+        if goal is None:
+            return
+        if "final_total" not in goal:
+            # Goal completed before these fields existed —
+            # compute once and cache back into the data
+            goal["final_total"] = sum(goal["log_progress"])
+            goal["days_taken"] = len(goal["log_dates"])
+            self.tracker._mark_dirty()
+        details = (
+            f"Goal: {goal['name']}\n"
+            f"Total {goal['unit']}: {goal['final_total']:.1f}\n"
+            f"Completed on: {goal.get('completion_date', 'N/A')}\n"
+            f"Days Taken: {goal['days_taken']}"
+        )
+        messagebox.showinfo("Completed Goal Details", details)
+
+    def on_close(self):
+        self.tracker.close()
+        self.root.destroy()
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = GoalTrackerApp(root)
     root.mainloop()
\ No newline at end of file